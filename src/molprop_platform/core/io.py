@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
 
-def read_table(path: str | Path) -> pd.DataFrame:
+def read_table(
+    path: str | Path,
+    columns: Optional[Sequence[str]] = None,
+    dtype_backend: Optional[str] = None,
+) -> pd.DataFrame:
     """Read CSV/TSV/Parquet into a DataFrame.
 
     This intentionally duplicates a tiny bit of functionality so molprop-platform
@@ -13,27 +19,135 @@ def read_table(path: str | Path) -> pd.DataFrame:
 
     When molprop-toolkit is installed, platform tools should prefer importing
     molprop_toolkit.core.read_table for consistent behavior.
+
+    columns restricts the read to a subset of columns; for Parquet the selection
+    is pushed down so unread columns are never decoded. dtype_backend is passed
+    through to pandas ("numpy_nullable" or "pyarrow") when given.
+
+    CSV/TSV files are parsed with pandas' multi-threaded pyarrow engine when
+    pyarrow is installed. The result is then Arrow-backed by default
+    (dtype_backend="pyarrow"): use .to_numpy() rather than .values to get NumPy
+    arrays, or pass dtype_backend="numpy_nullable". Without pyarrow the C engine
+    is used and dtypes are NumPy as before.
+    """
+
+    p = Path(path)
+    suffix = p.suffix.lower()
+
+    kwargs: dict[str, Any] = {}
+    if dtype_backend is not None:
+        kwargs["dtype_backend"] = dtype_backend
+    cols = list(columns) if columns is not None else None
+
+    if suffix == ".parquet":
+        return pd.read_parquet(p, columns=cols, **kwargs)
+    if suffix in (".csv", ".txt"):
+        return _read_csv(p, sep=",", usecols=cols, dtype_backend=dtype_backend)
+    if suffix == ".tsv":
+        return _read_csv(p, sep="\t", usecols=cols, dtype_backend=dtype_backend)
+
+    raise ValueError(f"Unsupported input format: {p}")
+
+
+def _read_csv(
+    p: Path,
+    *,
+    sep: str,
+    usecols: Optional[list[str]],
+    dtype_backend: Optional[str],
+) -> pd.DataFrame:
+    if importlib.util.find_spec("pyarrow") is None:
+        kwargs: dict[str, Any] = {}
+        if dtype_backend is not None:
+            kwargs["dtype_backend"] = dtype_backend
+        return pd.read_csv(p, sep=sep, usecols=usecols, **kwargs)
+
+    return pd.read_csv(
+        p,
+        sep=sep,
+        usecols=usecols,
+        engine="pyarrow",
+        dtype_backend=dtype_backend or "pyarrow",
+    )
+
+
+# Read-buffer size for preview_table's streaming Parquet reads.
+_PREVIEW_BUFFER_BYTES = 64 * 1024
+
+
+def preview_table(path: str | Path, n: int = 20) -> pd.DataFrame:
+    """Read only the first n rows of a CSV/TSV/Parquet table.
+
+    Parquet is read as a buffered stream without pre-buffering, so only the
+    first data pages of each column are fetched and decoded rather than the
+    whole first row group (which is the entire file for single-row-group
+    tables). Keeps UI previews of multi-GB tables cheap.
     """
 
     p = Path(path)
     suffix = p.suffix.lower()
 
     if suffix == ".parquet":
-        return pd.read_parquet(p)
+        import pyarrow.parquet as pq
+
+        pf = pq.ParquetFile(p, buffer_size=_PREVIEW_BUFFER_BYTES, pre_buffer=False)
+        batch = next(pf.iter_batches(batch_size=n), None)
+        if batch is None:
+            return pf.schema_arrow.empty_table().to_pandas()
+        return batch.to_pandas()
     if suffix in (".csv", ".txt"):
-        return pd.read_csv(p)
+        return pd.read_csv(p, nrows=n)
     if suffix == ".tsv":
-        return pd.read_csv(p, sep="\t")
+        return pd.read_csv(p, sep="\t", nrows=n)
 
     raise ValueError(f"Unsupported input format: {p}")
 
 
-def write_table(df: pd.DataFrame, path: str | Path) -> None:
+def write_table(
+    df: pd.DataFrame,
+    path: str | Path,
+    *,
+    compression: Optional[str] = "zstd",
+    compression_level: Optional[int] = None,
+    row_group_size: int = 64_000,
+) -> None:
+    """Write a DataFrame as CSV/TSV/Parquet.
+
+    Parquet is written with pyarrow directly so compression and row-group size
+    are explicit: zstd (level 3 unless compression_level is given) and 64k-row
+    groups, which keeps files small and lets column-projected reads skip data.
+    Dictionary encoding is limited to string-like columns (IDs, SMILES, flags);
+    high-cardinality float descriptors gain nothing from it.
+    The compression options are ignored for CSV/TSV.
+    """
+
     p = Path(path)
     suffix = p.suffix.lower()
 
     if suffix == ".parquet":
-        df.to_parquet(p, index=False)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if compression_level is None and compression == "zstd":
+            compression_level = 3
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        dictionary_columns = [
+            field.name
+            for field in table.schema
+            if pa.types.is_string(field.type)
+            or pa.types.is_large_string(field.type)
+            or pa.types.is_dictionary(field.type)
+        ]
+        pq.write_table(
+            table,
+            p,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+            use_dictionary=dictionary_columns or False,
+            write_statistics=True,
+            data_page_size=1024 * 1024,
+        )
         return
     if suffix == ".csv":
         df.to_csv(p, index=False)
@@ -5,6 +5,8 @@ from pathlib import Path
 
 
 def main() -> int:
+    from molprop_platform.viz.projectors import BACKENDS, DEFAULT_BACKEND, PROJECTORS
+
     parser = argparse.ArgumentParser(
         prog="molprop-visualize",
         description=(
@@ -12,11 +14,13 @@ def main() -> int:
             "This is a v1 skeleton that intentionally keeps behavior simple and table-first."
         ),
     )
-    parser.add_argument("table", help="Input results table (.csv/.tsv/.parquet)")
+    parser.add_argument(
+        "table", nargs="?", help="Input results table (.csv/.tsv/.parquet)"
+    )
     parser.add_argument("-o", "--outdir", default="viz", help="Output directory")
     parser.add_argument(
         "--method",
-        choices=["pca", "umap"],
+        choices=sorted(PROJECTORS),
         default="pca",
         help="Projection method",
     )
@@ -25,8 +29,50 @@ def main() -> int:
         default="Compound_ID",
         help="ID column to carry through into the projection table",
     )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default=None,
+        help=(
+            "Compute backend (default: $MOLPROP_BACKEND, else sklearn). 'cuml' runs "
+            "PCA/UMAP on the GPU via RAPIDS cuML and falls back to sklearn when cuML "
+            "is not importable; GPU results are not bit-for-bit reproducible."
+        ),
+    )
+
+    parser.add_argument(
+        "--max-hover-points",
+        type=int,
+        default=5000,
+        help=(
+            "Keep hover labels for at most this many (randomly sampled) points to bound "
+            "HTML size; above 50k points the cloud is drawn as a datashader density "
+            "image when datashader is installed"
+        ),
+    )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help=(
+            "Compile UMAP's cacheable numba kernels into the on-disk cache "
+            "($NUMBA_CACHE_DIR) and exit; run once after install, no table needed"
+        ),
+    )
 
     args = parser.parse_args()
+    if args.warmup:
+        from molprop_platform.viz.projectors import warmup_umap
+
+        warmup_umap()
+        print("UMAP kernels compiled into the numba cache")
+        return 0
+    if args.table is None:
+        parser.error("the following arguments are required: table")
+    if args.backend is None and DEFAULT_BACKEND not in BACKENDS:
+        parser.error(
+            f"invalid MOLPROP_BACKEND {DEFAULT_BACKEND!r} "
+            f"(choose from {', '.join(sorted(BACKENDS))})"
+        )
 
     from molprop_platform.viz.core import build_projection
 
@@ -36,6 +82,8 @@ def main() -> int:
         outdir=outdir,
         method=args.method,
         id_col=args.id_col,
+        backend=args.backend,
+        max_hover_points=args.max_hover_points,
     )
 
     print(f"Wrote: {res.projection_csv}")
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from molprop_platform.core.io import read_table
+from molprop_platform.viz.projectors import resolve_projector
+
+
+@dataclass(frozen=True)
+class ProjectionResult:
+    method: str
+    projection_csv: Path
+    projection_html: Path
+    backend: str = "sklearn"
+
+
+def _projection_columns(table: str | Path, id_col: str) -> Optional[list[str]]:
+    """Numeric + ID columns of a Parquet table, read from its schema only.
+
+    Returns None when the needed columns can't be known without a full read
+    (CSV/TSV), in which case the whole table is loaded.
+    """
+
+    p = Path(table)
+    if p.suffix.lower() != ".parquet":
+        return None
+    try:
+        import pyarrow.parquet as pq
+        import pyarrow.types as pat
+    except ImportError:
+        return None
+
+    return [
+        field.name
+        for field in pq.read_schema(p)
+        if field.name == id_col
+        or (
+            (pat.is_integer(field.type) or pat.is_floating(field.type))
+            and not field.name.startswith("__index_level_")
+        )
+    ]
+
+
+def _column_values(df: pd.DataFrame, name: str) -> Any:
+    """Return a column's backing array without building (and caching) a Series.
+
+    Reads straight from the block manager, which is much cheaper than
+    df[name] on wide frames; falls back to the public API if pandas internals
+    differ from what this expects.
+    """
+    try:
+        loc = df.columns.get_loc(name)
+        mgr = df._mgr
+        return mgr.blocks[mgr.blknos[loc]].iget(mgr.blklocs[loc])
+    except Exception:
+        return df[name].to_numpy()
+
+
+def compute_projection(
+    table: str | Path,
+    *,
+    method: str = "pca",
+    id_col: str = "Compound_ID",
+    backend: Optional[str] = None,
+) -> tuple[pd.DataFrame, str]:
+    """Project the numeric columns of a results table to 2D.
+
+    Returns (projection, backend) where projection holds the ID column (when
+    present) plus the two coordinate columns, and backend is the backend that
+    actually ran.
+
+    backend defaults to $MOLPROP_BACKEND (else "sklearn"). backend="cuml" runs
+    PCA/UMAP on the GPU via RAPIDS cuML when it is importable and falls back to
+    sklearn/umap-learn (with a warning) otherwise. GPU results are not
+    bit-for-bit reproducible across runs. See viz.projectors.
+    """
+
+    projector, backend = resolve_projector(method, backend)
+
+    df = read_table(table, columns=_projection_columns(table, id_col))
+
+    # A numeric ID column (e.g. integer compound IDs) is not a descriptor.
+    num_df = df.drop(columns=[id_col], errors="ignore").select_dtypes(
+        include=["number"]
+    )
+    if num_df.shape[1] < 2:
+        raise ValueError(
+            "Need at least two numeric columns to build a projection "
+            f"(found {num_df.shape[1]})."
+        )
+    # Materialize the descriptor matrix once as float32 (half the memory
+    # bandwidth of float64 for the SVD/kNN passes), then impute missing and
+    # non-finite values with column medians in place rather than copying the
+    # frame for fillna(). Columns with no finite values become 0.
+    X = np.ascontiguousarray(num_df.to_numpy(dtype=np.float32, na_value=np.nan))
+    missing = ~np.isfinite(X)
+    if missing.any():
+        X[missing] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            medians = np.nanmedian(X, axis=0)
+        np.nan_to_num(medians, copy=False, nan=0.0)
+        X[missing] = medians[np.nonzero(missing)[1]]
+
+    coords, (xname, yname) = projector(X)
+
+    proj = pd.DataFrame({xname: coords[:, 0], yname: coords[:, 1]})
+    if id_col in df.columns:
+        proj.insert(0, id_col, _column_values(df, id_col))
+        proj[id_col] = proj[id_col].astype(str)
+
+    return proj, backend
+
+
+# Above this many points the full scatter is replaced by a datashader density
+# image (when datashader is installed); hover stays on a sampled overlay.
+_DENSITY_THRESHOLD = 50_000
+
+
+def _axis_range(values: pd.Series) -> tuple[float, float]:
+    """(min, max) of a coordinate, padded by 0.5 when the axis is degenerate.
+
+    datashader divides by the range width, so a constant axis would raise.
+    """
+    lo, hi = float(values.min()), float(values.max())
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return lo, hi
+
+
+def _density_image(
+    proj: pd.DataFrame, xname: str, yname: str
+) -> Optional[tuple[Any, tuple[float, float], tuple[float, float]]]:
+    """Rasterize all points with datashader; None when datashader is missing."""
+    try:
+        import datashader as ds
+        import datashader.transfer_functions as tf
+    except ImportError:
+        return None
+
+    x_range = _axis_range(proj[xname])
+    y_range = _axis_range(proj[yname])
+    canvas = ds.Canvas(
+        plot_width=800, plot_height=600, x_range=x_range, y_range=y_range
+    )
+    agg = canvas.points(proj, xname, yname)
+    return tf.shade(agg, how="eq_hist").to_pil(), x_range, y_range
+
+
+def _projection_figure(
+    proj: pd.DataFrame,
+    *,
+    xname: str,
+    yname: str,
+    hover_name: Optional[str],
+    title: str,
+    max_hover_points: int,
+) -> Any:
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    if len(proj) <= max_hover_points:
+        # WebGL keeps large projections interactive; SVG stalls past ~10k points.
+        return px.scatter(
+            proj,
+            x=xname,
+            y=yname,
+            hover_name=hover_name,
+            title=title,
+            render_mode="webgl",
+        )
+
+    # Plotly serializes every hover string into the HTML, so only a sample of
+    # points carries hover text; the rest are drawn without it.
+    marker = {"size": 4, "opacity": 0.6, "color": "#636efa"}
+    fig = go.Figure()
+
+    density = (
+        _density_image(proj, xname, yname) if len(proj) > _DENSITY_THRESHOLD else None
+    )
+    if density is None:
+        fig.add_trace(
+            go.Scattergl(
+                x=proj[xname],
+                y=proj[yname],
+                mode="markers",
+                marker=marker,
+                hoverinfo="skip",
+            )
+        )
+    else:
+        image, x_range, y_range = density
+        fig.add_layout_image(
+            source=image,
+            xref="x",
+            yref="y",
+            x=x_range[0],
+            y=y_range[1],
+            sizex=x_range[1] - x_range[0],
+            sizey=y_range[1] - y_range[0],
+            sizing="stretch",
+            layer="below",
+        )
+        fig.update_xaxes(range=x_range)
+        fig.update_yaxes(range=y_range)
+
+    if max_hover_points > 0:
+        sample = proj.sample(n=max_hover_points, random_state=0)
+        fig.add_trace(
+            go.Scattergl(
+                x=sample[xname],
+                y=sample[yname],
+                mode="markers",
+                marker=marker,
+                hovertext=sample[hover_name] if hover_name else None,
+            )
+        )
+
+    fig.update_layout(
+        title=title, xaxis_title=xname, yaxis_title=yname, showlegend=False
+    )
+    return fig
+
+
+def write_projection(
+    proj: pd.DataFrame,
+    *,
+    outdir: str | Path,
+    method: str,
+    id_col: str = "Compound_ID",
+    backend: str = "sklearn",
+    max_hover_points: int = 5000,
+) -> ProjectionResult:
+    """Write projection_<method>.csv and projection_<method>.html into outdir.
+
+    Beyond max_hover_points rows, hover labels are kept only for a random
+    sample of that size, and beyond 50k rows the full point cloud is drawn as a
+    datashader density image when datashader is installed. The CSV always has
+    every row.
+    """
+
+    xname, yname = proj.columns[-2:]
+    hover_name = id_col if id_col in proj.columns else None
+
+    out = Path(outdir)
+    out.mkdir(parents=True, exist_ok=True)
+    csv_path = out / f"projection_{method}.csv"
+    html_path = out / f"projection_{method}.html"
+
+    proj.to_csv(csv_path, index=False)
+
+    fig = _projection_figure(
+        proj,
+        xname=xname,
+        yname=yname,
+        hover_name=hover_name,
+        title=f"{method.upper()} projection",
+        max_hover_points=max_hover_points,
+    )
+    fig.write_html(str(html_path), include_plotlyjs="cdn")
+
+    return ProjectionResult(
+        method=method,
+        projection_csv=csv_path,
+        projection_html=html_path,
+        backend=backend,
+    )
+
+
+def build_projection(
+    table: str | Path,
+    *,
+    outdir: str | Path,
+    method: str = "pca",
+    id_col: str = "Compound_ID",
+    backend: Optional[str] = None,
+    max_hover_points: int = 5000,
+) -> ProjectionResult:
+    """Project the numeric columns of a results table to 2D and plot them.
+
+    Writes projection_<method>.csv and projection_<method>.html into outdir.
+    Requires the [viz] extra. See compute_projection for backend semantics and
+    write_projection for how large projections are plotted.
+    """
+
+    proj, used_backend = compute_projection(
+        table, method=method, id_col=id_col, backend=backend
+    )
+    return write_projection(
+        proj,
+        outdir=outdir,
+        method=method,
+        id_col=id_col,
+        backend=used_backend,
+        max_hover_points=max_hover_points,
+    )
@@ -0,0 +1,176 @@
+"""2D projection functions, keyed by compute backend and method.
+
+Every projector takes a finite, C-contiguous float32 matrix (it may modify it
+in place) and returns (coords, (xname, yname)). New methods or backends plug in
+by adding an entry to BACKENDS; build_projection and the CLI pick them up
+without further conditionals.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+Projector = Callable[[np.ndarray], Tuple[np.ndarray, Tuple[str, str]]]
+
+
+_SKLEARNEX_PATCHED = False
+
+
+def _maybe_patch_sklearn() -> None:
+    """Route sklearn estimators through scikit-learn-intelex when opted in.
+
+    Enabled by setting MOLPROP_USE_SKLEARNEX=1; requires the [viz-intel] extra.
+    Must run before sklearn estimators are imported.
+    """
+
+    global _SKLEARNEX_PATCHED
+    if _SKLEARNEX_PATCHED or os.environ.get("MOLPROP_USE_SKLEARNEX", "0") in ("", "0"):
+        return
+
+    try:
+        from sklearnex import patch_sklearn
+    except ImportError as e:
+        raise RuntimeError(
+            "MOLPROP_USE_SKLEARNEX is set but scikit-learn-intelex is not installed. "
+            "Install with: pip install -e '.[viz-intel]'"
+        ) from e
+
+    patch_sklearn(verbose=False)
+    _SKLEARNEX_PATCHED = True
+
+
+def _configure_numba_cache() -> None:
+    """Give numba a stable, writable on-disk JIT cache.
+
+    umap-learn and pynndescent compile their kernels with cache=True; with a
+    persistent cache directory later processes skip most of that compile cost.
+    Has to run before numba is first imported.
+    """
+    os.environ.setdefault(
+        "NUMBA_CACHE_DIR", str(Path.home() / ".cache" / "molprop" / "numba")
+    )
+
+
+def warmup_umap() -> None:
+    """Compile umap-learn's cached numba kernels into the on-disk cache.
+
+    Fits a small random float32 matrix (large enough to take the
+    nearest-neighbour-descent path, like real tables). Only the kernels that
+    umap-learn/pynndescent declare with cache=True persist, so this is a
+    one-off "fill the cache" step (molscope-visualize --warmup), not something
+    to run ahead of a real fit in the same session.
+    """
+    _configure_numba_cache()
+    import umap
+
+    X = np.random.default_rng(0).random((4200, 4), dtype=np.float32)
+    umap.UMAP(n_components=2, n_epochs=10, random_state=0).fit_transform(X)
+
+
+def _import_cuml() -> Optional[Any]:
+    """Return the cuml module, or None when RAPIDS/CUDA is unavailable."""
+    try:
+        import cuml
+    except Exception:
+        # ImportError without RAPIDS, or CUDA runtime errors on GPU-less hosts.
+        return None
+    return cuml
+
+
+def pca_project(X: np.ndarray) -> Tuple[np.ndarray, Tuple[str, str]]:
+    _maybe_patch_sklearn()
+    from sklearn import config_context
+    from sklearn.decomposition import PCA
+
+    X -= X.mean(axis=0, keepdims=True)
+    if _SKLEARNEX_PATCHED:
+        # oneDAL only offloads the full/covariance_eigh solvers (randomized
+        # falls back to stock sklearn); eigh of the d x d covariance is the
+        # cheap one when rows outnumber descriptors.
+        n, d = X.shape
+        solver = "covariance_eigh" if n >= d else "full"
+        pca = PCA(n_components=2, svd_solver=solver)
+    else:
+        # Only two components are needed, so a randomized truncated SVD on
+        # pre-centered float32 data avoids the full O(min(n,d)^2 max(n,d)) SVD.
+        pca = PCA(n_components=2, svd_solver="randomized", random_state=0)
+    # X is finite by construction; skip sklearn's full-matrix validation scan.
+    with config_context(assume_finite=True):
+        coords = pca.fit_transform(X)
+    return coords, ("PCA_1", "PCA_2")
+
+
+def umap_project(X: np.ndarray) -> Tuple[np.ndarray, Tuple[str, str]]:
+    _maybe_patch_sklearn()
+    _configure_numba_cache()
+    import umap
+    from sklearn import config_context
+
+    # low_memory streams NN-descent candidates instead of caching them.
+    reducer = umap.UMAP(n_components=2, random_state=0, low_memory=True)
+    with config_context(assume_finite=True):
+        coords = reducer.fit_transform(X)
+    return coords, ("UMAP_1", "UMAP_2")
+
+
+def cuml_pca_project(X: np.ndarray) -> Tuple[np.ndarray, Tuple[str, str]]:
+    import cuml
+
+    X -= X.mean(axis=0, keepdims=True)
+    coords = cuml.PCA(n_components=2, output_type="numpy").fit_transform(X)
+    return coords, ("PCA_1", "PCA_2")
+
+
+def cuml_umap_project(X: np.ndarray) -> Tuple[np.ndarray, Tuple[str, str]]:
+    import cuml
+
+    reducer = cuml.UMAP(n_components=2, random_state=0, output_type="numpy")
+    return reducer.fit_transform(X), ("UMAP_1", "UMAP_2")
+
+
+PROJECTORS: Dict[str, Projector] = {
+    "pca": pca_project,
+    "umap": umap_project,
+}
+
+BACKENDS: Dict[str, Dict[str, Projector]] = {
+    "sklearn": PROJECTORS,
+    "cuml": {
+        "pca": cuml_pca_project,
+        "umap": cuml_umap_project,
+    },
+}
+
+# Backend used when callers don't pass one explicitly.
+DEFAULT_BACKEND = os.environ.get("MOLPROP_BACKEND", "sklearn")
+
+
+def resolve_projector(
+    method: str, backend: Optional[str] = None
+) -> Tuple[Projector, str]:
+    """Return (projector, backend actually used) for a method/backend pair.
+
+    backend="cuml" falls back to sklearn/umap-learn (with a RuntimeWarning) when
+    cuML cannot be imported.
+    """
+
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend}")
+    if method not in BACKENDS[backend]:
+        raise ValueError(f"Unsupported projection method: {method}")
+
+    if backend == "cuml" and _import_cuml() is None:
+        warnings.warn(
+            "cuML is not available; falling back to the sklearn backend.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        backend = "sklearn"
+
+    return BACKENDS[backend][method], backend
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import streamlit as st
 
-from molprop_platform.viz.core import build_projection
+from molprop_platform.core.io import preview_table
+from molprop_platform.viz.core import compute_projection, write_projection
+from molprop_platform.viz.projectors import PROJECTORS
 from molprop_platform.web.runner import (
     detect_input_kind,
     make_run_dir,
+    read_run_bundle,
     run_command_capture,
     save_uploaded_file,
     try_run_toolkit_pipeline,
     which,
     write_run_metadata,
-    zip_run_directory,
 )
 
 st.set_page_config(page_title="MolScope Server", layout="wide")
@@ -49,6 +53,30 @@ def _status_row() -> None:
 
 _status_row()
 
+
+_PREVIEW_ROWS = 20
+
+
+# Streamlit reruns this script on every widget interaction, and every rerun
+# saves the upload into a fresh run directory. Cache on the upload identity
+# (leading-underscore args are excluded from the cache key) so a table is
+# parsed and projected once per upload rather than once per click.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_preview(upload_key: str, _path: Path) -> pd.DataFrame:
+    return preview_table(_path, _PREVIEW_ROWS)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_projection(
+    upload_key: str, _path: Path, method: str, id_col: str
+) -> tuple[pd.DataFrame, str]:
+    return compute_projection(_path, method=method, id_col=id_col)
+
+
+def _upload_key(uploaded: Any) -> str:
+    return f"{uploaded.file_id}:{uploaded.name}:{uploaded.size}"
+
+
 st.markdown("""
 Both workflows converge on the same artifact: a MolProp results table (CSV/Parquet) plus a run folder containing logs,
 plots, and optional reports. The safest long-term interface between **molprop-toolkit** and **molscope** is
@@ -140,10 +168,10 @@ with tab_generate:
                 if res.get(key):
                     st.text_area(key, res[key], height=220)
 
-            zip_bytes = zip_run_directory(ctx)
+            # Deferred: the bundle is only built when the button is clicked.
             st.download_button(
                 "Download run bundle (zip)",
-                data=zip_bytes,
+                data=partial(read_run_bundle, ctx),
                 file_name=f"{ctx.run_dir.name}.zip",
                 mime="application/zip",
             )
@@ -169,22 +197,18 @@ with tab_analyze:
 
         # Lightweight preview
         try:
-            if table_path.suffix.lower() == ".parquet":
-                df = pd.read_parquet(table_path)
-            elif table_path.suffix.lower() == ".tsv":
-                df = pd.read_csv(table_path, sep="\t")
-            else:
-                df = pd.read_csv(table_path)
-            st.dataframe(df.head(20), use_container_width=True)
+            df = _load_preview(_upload_key(uploaded_tbl), table_path)
+            # Slice rows first (a cheap view), then select columns if ever
+            # needed: preview[cols], never df[cols].iloc[:n] on wide tables.
+            preview = df.iloc[:_PREVIEW_ROWS]
+            st.dataframe(preview, use_container_width=True)
         except Exception:
-            st.info(
-                "Preview unavailable (file may be large or requires optional dependencies)."
-            )
+            st.info("Preview unavailable (file may require optional dependencies).")
 
         st.divider()
 
         st.markdown("### 1) Visualization")
-        method = st.selectbox("Projection method", ["pca", "umap"], index=0)
+        method = st.selectbox("Projection method", list(PROJECTORS), index=0)
         id_col = st.text_input("ID column", value="Compound_ID")
 
         viz_btn = st.button("Generate interactive plot")
@@ -192,11 +216,15 @@ with tab_analyze:
             with st.spinner("Building projection..."):
                 try:
                     outdir = ctx.run_dir / "outputs" / "viz"
-                    proj = build_projection(
-                        table_path,
+                    proj_df, backend = _cached_projection(
+                        _upload_key(uploaded_tbl), table_path, method, id_col
+                    )
+                    proj = write_projection(
+                        proj_df,
                         outdir=outdir,
                         method=method,
                         id_col=id_col,
+                        backend=backend,
                     )
                     st.success("Visualization created")
                     st.write(f"HTML: `{proj.projection_html}`")
@@ -250,10 +278,10 @@ with tab_analyze:
 
         write_run_metadata(ctx, {"mode": "analyze", "input": str(table_path)})
 
-        zip_bytes = zip_run_directory(ctx)
+        # Deferred: the bundle is only built when the button is clicked.
         st.download_button(
             "Download run bundle (zip)",
-            data=zip_bytes,
+            data=partial(read_run_bundle, ctx),
             file_name=f"{ctx.run_dir.name}.zip",
             mime="application/zip",
         )
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import shutil
 import subprocess
 import sys
 import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Deque, Dict, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -34,13 +38,15 @@ def make_run_dir(base_dir: str | Path = "runs") -> RunContext:
 
 
 def save_uploaded_file(uploaded: Any, dest: Path) -> Path:
-    """Save a Streamlit UploadedFile-like object to disk."""
+    """Save a Streamlit UploadedFile-like (binary file) object to disk.
+
+    Copies in 1 MiB chunks so large uploads are never duplicated in memory.
+    """
     dest.parent.mkdir(parents=True, exist_ok=True)
 
-    data = uploaded.getvalue() if hasattr(uploaded, "getvalue") else uploaded.read()
-    if isinstance(data, str):
-        data = data.encode("utf-8")
-    dest.write_bytes(data)
+    uploaded.seek(0)
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(uploaded, f, length=1024 * 1024)
     return dest
 
 
@@ -48,6 +54,21 @@ def which(cmd: str) -> Optional[str]:
     return shutil.which(cmd)
 
 
+def _tail_lines(path: Path, n: int = 80, block_size: int = 64 * 1024) -> str:
+    """Return the last n lines of a text file, reading backwards from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()[-n:]
+    return "\n".join(lines)
+
+
 def run_command_capture(
     cmd: list[str],
     cwd: Path,
@@ -56,24 +77,24 @@ def run_command_capture(
 ) -> Tuple[int, str]:
     """Run a command and capture combined stdout/stderr to a file.
 
+    Output is streamed straight to log_path by the child process, so memory use
+    does not grow with log size.
+
     Returns (returncode, tail_text) where tail_text is a short excerpt for UI.
     """
 
-    proc = subprocess.run(
-        cmd,
-        cwd=str(cwd),
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        check=False,
-    )
-
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_path.write_text(proc.stdout)
+    with open(log_path, "wb") as lf:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            env=env,
+            stdout=lf,
+            stderr=subprocess.STDOUT,
+        )
+        rc = proc.wait()
 
-    tail = proc.stdout.splitlines()[-80:]
-    return proc.returncode, "\n".join(tail)
+    return rc, _tail_lines(log_path, 80)
 
 
 def detect_input_kind(path: Path) -> str:
@@ -96,16 +117,147 @@ def write_run_metadata(ctx: RunContext, payload: Dict[str, Any]) -> Path:
     return out
 
 
-def zip_run_directory(ctx: RunContext) -> bytes:
-    """Return a ZIP archive (bytes) for the run directory."""
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for path in ctx.run_dir.rglob("*"):
+# Outputs that are already compressed gain nothing from deflate; store them as-is.
+_STORED_SUFFIXES = frozenset(
+    {".parquet", ".png", ".jpg", ".jpeg", ".gif", ".zip", ".gz", ".bz2", ".xz", ".zst"}
+)
+
+
+# Larger members are streamed through zipfile on the writer thread instead of
+# being read whole into memory for a worker.
+_PARALLEL_MAX_BYTES = 16 * 1024 * 1024
+
+# Default upper bound on deflate threads when the caller doesn't pick a count.
+_MAX_ZIP_WORKERS = 8
+
+
+def _deflate_file(path: Path) -> Tuple[bytes, int, int]:
+    """Raw-deflate a file at level 1; returns (payload, crc32, file_size)."""
+    data = path.read_bytes()
+    co = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+    payload = co.compress(data) + co.flush()
+    return payload, zlib.crc32(data), len(data)
+
+
+def _write_deflated_member(
+    zf: zipfile.ZipFile,
+    path: Path,
+    arcname: str,
+    payload: bytes,
+    crc: int,
+    file_size: int,
+) -> None:
+    """Append an already-deflated member to an open ZipFile.
+
+    zipfile has no public API for precompressed data, so this mirrors what
+    ZipFile.mkdir does for directory entries: write the local header and
+    payload directly, then register the ZipInfo for the central directory.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(payload)
+
+    with zf._lock:
+        if zf._seekable:
+            zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader())
+        zf.fp.write(payload)
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()
+
+
+def _write_run_zip(
+    ctx: RunContext, fileobj: Any, workers: Optional[int] = None
+) -> None:
+    """Write the run directory as a ZIP into fileobj.
+
+    Compressible members up to _PARALLEL_MAX_BYTES are deflated concurrently in
+    a thread pool (zlib releases the GIL) and appended in directory order; a
+    bounded window of in-flight members keeps memory flat.
+    """
+    # Capped: cpu_count() reports host CPUs inside containers, and each worker
+    # holds up to two members' worth of raw + deflated bytes in the window.
+    workers = workers or min(_MAX_ZIP_WORKERS, os.cpu_count() or 1)
+    window = 2 * workers
+    pending: Deque[Tuple[Path, str, Optional[Future]]] = deque()
+
+    with (
+        zipfile.ZipFile(fileobj, mode="w") as zf,
+        ThreadPoolExecutor(max_workers=workers) as pool,
+    ):
+
+        def drain(limit: int) -> None:
+            while len(pending) > limit:
+                path, arcname, fut = pending.popleft()
+                if fut is not None:
+                    _write_deflated_member(zf, path, arcname, *fut.result())
+                elif path.suffix.lower() in _STORED_SUFFIXES:
+                    zf.write(path, arcname=arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    # Level 1 is roughly half the CPU of the default level 6.
+                    zf.write(
+                        path,
+                        arcname=arcname,
+                        compress_type=zipfile.ZIP_DEFLATED,
+                        compresslevel=1,
+                    )
+
+        for path in sorted(ctx.run_dir.rglob("*")):
             if path.is_dir():
                 continue
-            zf.write(path, arcname=str(path.relative_to(ctx.run_dir)))
-    buf.seek(0)
-    return buf.read()
+            fut = None
+            if (
+                path.suffix.lower() not in _STORED_SUFFIXES
+                and path.stat().st_size <= _PARALLEL_MAX_BYTES
+            ):
+                fut = pool.submit(_deflate_file, path)
+            pending.append((path, str(path.relative_to(ctx.run_dir)), fut))
+            drain(window)
+        drain(0)
+
+
+def zip_run_directory(ctx: RunContext) -> bytes:
+    """Return a ZIP archive (bytes) for the run directory.
+
+    Prefer zip_run_directory_stream for large runs; this holds the whole archive
+    in memory.
+    """
+    buf = io.BytesIO()
+    _write_run_zip(ctx, buf)
+    return buf.getvalue()
+
+
+def zip_run_directory_stream(ctx: RunContext, workers: Optional[int] = None) -> Path:
+    """Write a ZIP archive of the run directory to disk and return its path.
+
+    The archive is written next to the run directory (runs/<run>.zip) so it is
+    not swept into itself, and members are streamed from disk in chunks, so peak
+    memory does not grow with the archive size.
+    """
+    out = ctx.run_dir.with_suffix(".zip")
+    with open(out, "wb") as f:
+        _write_run_zip(ctx, f, workers=workers)
+    return out
+
+
+def read_run_bundle(ctx: RunContext) -> bytes:
+    """Build the run bundle, return its bytes and delete the zip from disk.
+
+    Intended as a deferred download payload, so the archive is only built when
+    requested and no runs/<run>.zip is left behind.
+    """
+    zip_path = zip_run_directory_stream(ctx)
+    try:
+        with zip_path.open("rb") as f:
+            return f.read()
+    finally:
+        zip_path.unlink(missing_ok=True)
 
 
 def try_run_toolkit_pipeline(
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from molprop_platform.core.io import preview_table, read_table, write_table
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Compound_ID": ["A", "B", "C"],
+            "SMILES": ["C", "CC", "CCC"],
+            "MolWt": [16.0, 30.1, 44.1],
+        }
+    )
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".tsv"])
+def test_read_table_columns_text(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"t{suffix}"
+    _frame().to_csv(path, sep="\t" if suffix == ".tsv" else ",", index=False)
+
+    df = read_table(path, columns=["Compound_ID", "MolWt"])
+    assert list(df.columns) == ["Compound_ID", "MolWt"]
+    assert len(df) == 3
+
+
+def test_read_table_columns_parquet(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "t.parquet"
+    _frame().to_parquet(path, index=False)
+
+    df = read_table(path, columns=["MolWt"])
+    assert list(df.columns) == ["MolWt"]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_preview_table_bounded(tmp_path: Path, suffix: str) -> None:
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"Compound_ID": [f"C{i}" for i in range(100)], "x": range(100)})
+    path = tmp_path / f"t{suffix}"
+    if suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+    head = preview_table(path, 5)
+    assert list(head["Compound_ID"]) == ["C0", "C1", "C2", "C3", "C4"]
+
+
+def test_preview_table_single_row_group(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    n = 200_000
+    df = pd.DataFrame({"Compound_ID": [f"C{i}" for i in range(n)], "x": range(n)})
+    path = tmp_path / "t.parquet"
+    # Small pages so the first row group spans many of them.
+    df.to_parquet(path, index=False, row_group_size=n, data_page_size=4096)
+
+    head = preview_table(path, 5)
+    pd.testing.assert_frame_equal(head, df.iloc[:5])
+
+
+def test_write_table_parquet_zstd(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = pd.DataFrame({"Compound_ID": [f"C{i}" for i in range(10)], "x": range(10)})
+    path = tmp_path / "t.parquet"
+
+    write_table(df, path, row_group_size=4)
+
+    meta = pq.ParquetFile(path).metadata
+    assert meta.num_row_groups == 3
+    assert meta.row_group(0).column(0).compression == "ZSTD"
+    # Dictionary encoding only for the string ID column, not the numeric one.
+    assert "RLE_DICTIONARY" in meta.row_group(0).column(0).encodings
+    assert "RLE_DICTIONARY" not in meta.row_group(0).column(1).encodings
+    pd.testing.assert_frame_equal(read_table(path), df)
+
+
+def test_read_table_unsupported(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        read_table(tmp_path / "t.xlsx")
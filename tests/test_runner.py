@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+from molprop_platform.web.runner import (
+    make_run_dir,
+    read_run_bundle,
+    run_command_capture,
+    save_uploaded_file,
+    zip_run_directory,
+    zip_run_directory_stream,
+)
+
+
+def test_zip_run_directory_stream(tmp_path: Path) -> None:
+    ctx = make_run_dir(tmp_path / "runs")
+    (ctx.run_dir / "logs" / "calc.log").write_text("ok\n" * 100)
+    (ctx.run_dir / "outputs" / "results.parquet").write_bytes(b"PAR1data")
+
+    zip_path = zip_run_directory_stream(ctx)
+    assert zip_path.parent == ctx.run_dir.parent
+
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert zf.read("logs/calc.log") == b"ok\n" * 100
+    assert infos["logs/calc.log"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["outputs/results.parquet"].compress_type == zipfile.ZIP_STORED
+
+    assert zip_run_directory(ctx)[:2] == b"PK"
+
+
+def test_zip_run_directory_parallel_roundtrip(tmp_path: Path) -> None:
+    ctx = make_run_dir(tmp_path / "runs")
+    expected = {}
+    for i in range(20):
+        name = f"outputs/table_{i}.csv"
+        data = ("Compound_ID,x\n" + f"C{i},{i}\n" * (i * 50)).encode()
+        (ctx.run_dir / name).write_bytes(data)
+        expected[name] = data
+
+    zip_path = zip_run_directory_stream(ctx, workers=4)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        for name, data in expected.items():
+            assert zf.read(name) == data
+
+
+def test_run_command_capture_tail(tmp_path: Path) -> None:
+    log_path = tmp_path / "logs" / "cmd.log"
+    cmd = [sys.executable, "-c", "for i in range(5000): print(f'line {i}')"]
+
+    rc, tail = run_command_capture(cmd, cwd=tmp_path, log_path=log_path)
+
+    assert rc == 0
+    assert tail.splitlines() == [f"line {i}" for i in range(4920, 5000)]
+    assert log_path.read_text().count("\n") == 5000
+
+
+def test_save_uploaded_file_rewinds(tmp_path: Path) -> None:
+    uploaded = io.BytesIO(b"CCO ethanol\n")
+    uploaded.read()
+
+    dest = save_uploaded_file(uploaded, tmp_path / "inputs" / "in.smi")
+
+    assert dest.read_bytes() == b"CCO ethanol\n"
+
+
+def test_read_run_bundle_removes_zip(tmp_path: Path) -> None:
+    ctx = make_run_dir(tmp_path / "runs")
+    (ctx.run_dir / "logs" / "calc.log").write_text("ok\n")
+
+    data = read_run_bundle(ctx)
+
+    assert data[:2] == b"PK"
+    assert not ctx.run_dir.with_suffix(".zip").exists()
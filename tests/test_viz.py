@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+def _write_table(path: Path, n: int = 50) -> Path:
+    df = pd.DataFrame(
+        {
+            "Compound_ID": [f"C{i}" for i in range(n)],
+            "SMILES": ["C"] * n,
+            "MolWt": [100.0 + i for i in range(n)],
+            "LogP": [None if i == 3 else (i % 7) * 0.5 for i in range(n)],
+            "TPSA": [float("inf") if i == 7 else 20.0 + (i % 5) for i in range(n)],
+            "Empty": [None] * n,
+        }
+    )
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_build_projection_pca(tmp_path: Path) -> None:
+    pytest.importorskip("sklearn")
+    pytest.importorskip("plotly")
+    from molprop_platform.viz.core import build_projection
+
+    table = _write_table(tmp_path / "results.csv")
+    res = build_projection(table, outdir=tmp_path / "viz", method="pca")
+
+    proj = pd.read_csv(res.projection_csv)
+    assert list(proj.columns) == ["Compound_ID", "PCA_1", "PCA_2"]
+    assert len(proj) == 50
+    assert not proj[["PCA_1", "PCA_2"]].isna().any().any()
+    assert "scattergl" in res.projection_html.read_text()
+
+
+def test_compute_projection_skips_numeric_id(tmp_path: Path) -> None:
+    pytest.importorskip("sklearn")
+    pytest.importorskip("pyarrow")
+    from molprop_platform.viz.core import compute_projection
+
+    df = pd.read_csv(_write_table(tmp_path / "results.csv"))
+    df["Compound_ID"] = [1000 + 37 * i for i in range(len(df))]
+    with_id = tmp_path / "with_id.parquet"
+    df.to_parquet(with_id, index=False)
+    without_id = tmp_path / "without_id.parquet"
+    df.drop(columns=["Compound_ID"]).to_parquet(without_id, index=False)
+
+    proj, _ = compute_projection(with_id, method="pca")
+    ref, _ = compute_projection(without_id, method="pca")
+
+    assert proj["Compound_ID"].iloc[0] == "1000"
+    pd.testing.assert_frame_equal(proj[["PCA_1", "PCA_2"]], ref)
+
+
+def test_write_projection_samples_hover(tmp_path: Path) -> None:
+    pytest.importorskip("plotly")
+    from molprop_platform.viz.core import write_projection
+
+    n = 200
+    proj = pd.DataFrame(
+        {
+            "Compound_ID": [f"ID_{i:05d}" for i in range(n)],
+            "PCA_1": [float(i) for i in range(n)],
+            "PCA_2": [float(i % 13) for i in range(n)],
+        }
+    )
+    res = write_projection(proj, outdir=tmp_path, method="pca", max_hover_points=10)
+
+    assert res.projection_html.read_text().count('"ID_') == 10
+    assert len(pd.read_csv(res.projection_csv)) == n
+
+
+def test_write_projection_density_constant_axis(tmp_path: Path) -> None:
+    pytest.importorskip("datashader")
+    from molprop_platform.viz.core import write_projection
+
+    n = 60_000
+    proj = pd.DataFrame(
+        {
+            "Compound_ID": [f"C{i}" for i in range(n)],
+            "PCA_1": [float(i % 97) for i in range(n)],
+            "PCA_2": [0.0] * n,
+        }
+    )
+    res = write_projection(
+        proj, outdir=tmp_path / "viz", method="pca", max_hover_points=100
+    )
+    assert res.projection_html.exists()
+
+
+def test_resolve_projector() -> None:
+    from molprop_platform.viz.projectors import PROJECTORS, resolve_projector
+
+    projector, backend = resolve_projector("pca", "sklearn")
+    assert projector is PROJECTORS["pca"]
+    assert backend == "sklearn"
+
+    with pytest.raises(ValueError):
+        resolve_projector("tsne", "sklearn")
+    with pytest.raises(ValueError):
+        resolve_projector("pca", "tpu")
+
+
+def test_resolve_projector_cuml_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    from molprop_platform.viz import projectors
+
+    monkeypatch.setattr(projectors, "_import_cuml", lambda: None)
+    with pytest.warns(RuntimeWarning, match="cuML"):
+        projector, backend = projectors.resolve_projector("pca", "cuml")
+    assert projector is projectors.PROJECTORS["pca"]
+    assert backend == "sklearn"
+
+
+def test_cli_rejects_invalid_env_backend(tmp_path: Path) -> None:
+    table = _write_table(tmp_path / "results.csv")
+    proc = subprocess.run(
+        [sys.executable, "-m", "molprop_platform.viz.cli", str(table)],
+        env={**os.environ, "MOLPROP_BACKEND": "gpu"},
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 2
+    assert "MOLPROP_BACKEND" in proc.stderr
+    assert "Traceback" not in proc.stderr
+
+
+def test_cli_umap_warmup_not_slower(tmp_path: Path) -> None:
+    pytest.importorskip("umap")
+    pytest.importorskip("plotly")
+
+    def run(args: list[str], cache_dir: Path) -> float:
+        # Each run starts from its own cold numba cache.
+        env = {**os.environ, "NUMBA_CACHE_DIR": str(cache_dir)}
+        cmd = [sys.executable, "-m", "molprop_platform.viz.cli", *args]
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=600)
+        assert proc.returncode == 0, proc.stderr
+        return time.perf_counter() - t0
+
+    # Large enough for UMAP's nearest-neighbour-descent path.
+    table = _write_table(tmp_path / "results.csv", n=5000)
+    plain = run(
+        [str(table), "-o", str(tmp_path / "viz"), "--method", "umap"],
+        tmp_path / "cache_plain",
+    )
+    assert (tmp_path / "viz" / "projection_umap.html").exists()
+
+    warmup = run(["--warmup"], tmp_path / "cache_warmup")
+    assert any((tmp_path / "cache_warmup").rglob("*.nbi"))
+    assert warmup <= plain
+
+
+def test_sklearnex_gate(monkeypatch: pytest.MonkeyPatch) -> None:
+    from molprop_platform.viz import projectors
+
+    monkeypatch.setattr(projectors, "_SKLEARNEX_PATCHED", False)
+
+    monkeypatch.delenv("MOLPROP_USE_SKLEARNEX", raising=False)
+    projectors._maybe_patch_sklearn()
+    assert not projectors._SKLEARNEX_PATCHED
+
+    monkeypatch.setenv("MOLPROP_USE_SKLEARNEX", "0")
+    projectors._maybe_patch_sklearn()
+    assert not projectors._SKLEARNEX_PATCHED
+
+    # None in sys.modules makes the import fail even where sklearnex exists.
+    monkeypatch.setenv("MOLPROP_USE_SKLEARNEX", "1")
+    monkeypatch.setitem(sys.modules, "sklearnex", None)
+    with pytest.raises(RuntimeError, match="viz-intel"):
+        projectors._maybe_patch_sklearn()
+    assert not projectors._SKLEARNEX_PATCHED